@@ -10,16 +10,72 @@ import requests
 import json
 import csv
 import datetime
+import functools
+import gzip
+import math
 import re
 import sys
 import os
-from io import StringIO
-from flask import Flask, request, Response, render_template_string
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from io import BytesIO, StringIO
+from flask import Flask, request, Response, render_template_string, stream_with_context
+from markupsafe import Markup, escape
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Use orjson to decode BASIS payloads when it is installed
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 # Configuration
 API_BASE_URL = "http://www.akleg.gov/publicservice/basis/"
 API_VERSION = "1.4"
 
+# Maximum number of dates fetched concurrently for range queries
+MAX_FETCH_WORKERS = 8
+
+# Number of CSV rows formatted per writerows call
+CSV_BATCH_ROWS = 64
+
+# Buffered CSV text (characters) to accumulate before yielding a chunk
+CSV_CHUNK_SIZE = 64 * 1024
+
+# Cache settings for BASIS responses (seconds / number of dates)
+CACHE_TTL = 300
+CACHE_MAXSIZE = 256
+
+# Constants
+# Date/time formats
+MDY_FMT = "%m/%d/%Y"
+MDY_SHORT_FMT = "%m/%d/%y"
+DOW_FMT = "%A %B %d, %Y"
+BASIS_TIME_FMT = "%H:%M:%S"
+BASIS_DATETIME_FMT = "%Y-%m-%d %H:%M:%S"
+DISPLAY_TIME_FMT = "%I:%M %p"
+CSV_DATETIME_FMT = "%Y-%m-%d %I:%M %p"
+
+# Highlight text markers (compared upper-cased)
+CANCEL_TEXT = "MEETING CANCELED"
+SKIP_MARKERS = frozenset({"NO MEETING SCHEDULED"})
+
+# Description text
+CANCELED_NOTICE = "** MEETING CANCELED **"
+STREAM_MARKER = "**Streamed live on AKL.tv**"
+SEP = " | "
+
+# Translation table for turning dates into filename-safe text
+_SLASH_TO_DASH = str.maketrans("/", "-")
+
+# Invintus CSV header and row as csv.QUOTE_ALL writes them; the row template
+# is only used for rows with no quotes to escape
+_INVINTUS_HEADER = '"title","customID","startDateTime","description","encoder","category","location","estRuntime","liveToBreak"\r\n'
+_INVINTUS_ROW_FMT = '"{}","{}","{}","{}","{}","{}","{}","{}","{}"\r\n'
+_INVINTUS_ROW_QUOTES = _INVINTUS_ROW_FMT.count('"')
+
 # Encoder options
 ENCODERS = [
     {"name": "> SRT-KTOOENC01", "id": "hm4mevet"},
@@ -35,83 +91,293 @@ ENCODERS = [
     {"name": "AK Leg Stream 6", "id": "hcrujfx7"}
 ]
 
+# Encoder names keyed by id for O(1) lookups
+ENCODER_BY_ID = {e["id"]: e["name"] for e in ENCODERS}
+
+# Encoder <option> elements, rendered once and reused for every meeting row
+ENCODER_OPTIONS_HTML = "".join(
+    f'<option value="{escape(encoder_id)}">{escape(name)}</option>' for encoder_id, name in ENCODER_BY_ID.items()
+)
+
+# Shared HTTP session so BASIS requests reuse pooled keep-alive connections
+SESSION = requests.Session()
+SESSION.headers.update({
+    "X-Alaska-Legislature-Basis-Version": API_VERSION,
+    "Accept-language": "en"
+})
+_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504])
+)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+
+# Cached meetings keyed by date in least recently used order: {date: (expires_at, meetings)}
+_meetings_cache = {}
+_meetings_cache_lock = threading.Lock()
+
+# Whether BASIS answers a startdate/enddate meetings query; None until verified
+_SUPPORTS_RANGE_QUERY = None
+
+# Monotonic time before which an inconclusive range query probe isn't retried
+_range_probe_retry_at = 0
+
 # Flask app setup
 app = Flask(__name__)
 
+class MeetingsFetchError(Exception):
+    """Raised when meetings can't be retrieved from the BASIS API"""
+    
+    def __init__(self, message, status_code=None):
+        super().__init__(message)
+        # HTTP status BASIS answered with, or None if it never answered
+        self.status_code = status_code
+
 def get_meetings(date):
-    """Gets meetings for a specific date"""
-    # Create headers for the request
+    """Gets meetings for a specific date, reusing a cached response while fresh"""
+    # Normalize so '4/2/2025' and '04/02/2025' share a cache entry
+    try:
+        date = _parse_mdy(date).strftime(MDY_FMT)
+    except ValueError:
+        pass
+    
+    now = time.monotonic()
+    cached = _get_cached_meetings(date, now)
+    if cached is not None:
+        return cached
+    
+    # Errors raise before reaching the cache, so the next request retries
+    meetings = _get_meetings_uncached(date)
+    _cache_meetings(date, meetings, now)
+    
+    return meetings
+
+def _get_cached_meetings(date, now):
+    """Return the cached meetings for a date, or None if missing or expired"""
+    with _meetings_cache_lock:
+        entry = _meetings_cache.get(date)
+        if not entry or entry[0] <= now:
+            return None
+        # Move hits to the end so eviction drops the least recently used date
+        del _meetings_cache[date]
+        _meetings_cache[date] = entry
+    return entry[1]
+
+def _cache_meetings(date, meetings, now):
+    """Store meetings for a date, evicting the least recently used date once full"""
+    # Past meetings don't change upstream, so only recent and future dates
+    # expire. The server clock may run up to a day ahead of Alaska, so
+    # yesterday here can still be today in Juneau.
+    try:
+        settled = _parse_mdy(date) < datetime.date.today() - datetime.timedelta(days=1)
+        expires_at = math.inf if settled else now + CACHE_TTL
+    except ValueError:
+        expires_at = now + CACHE_TTL
+    
+    with _meetings_cache_lock:
+        _meetings_cache.pop(date, None)
+        if len(_meetings_cache) >= CACHE_MAXSIZE:
+            _meetings_cache.pop(next(iter(_meetings_cache)))
+        _meetings_cache[date] = (expires_at, meetings)
+
+def clear_meetings_cache():
+    """Drop all cached meetings so the next request refetches from BASIS"""
+    global _SUPPORTS_RANGE_QUERY, _range_probe_retry_at
+    
+    with _meetings_cache_lock:
+        _meetings_cache.clear()
+    
+    # Probe range query support again as well
+    _SUPPORTS_RANGE_QUERY = None
+    _range_probe_retry_at = 0
+
+def _get_meetings_uncached(date):
+    """Gets meetings for a specific date from the BASIS API"""
+    return _query_meetings(f"meetings;date={date};details")
+
+def _query_meetings(query):
+    """Run a BASIS meetings query and return the list of meetings
+    
+    Raises MeetingsFetchError when the request fails or the response is malformed.
+    """
+    # Only the query header varies per call; the rest are session defaults
     headers = {
-        "X-Alaska-Legislature-Basis-Version": API_VERSION,
-        "X-Alaska-Legislature-Basis-Query": f"meetings;date={date};details",
-        "Accept-language": "en"
+        "X-Alaska-Legislature-Basis-Query": query
     }
     
     # Get the meetings data
     url = f"{API_BASE_URL}meetings?json=true"
     
     try:
-        response = requests.get(url, headers=headers)
+        response = SESSION.get(url, headers=headers)
         
         if response.status_code != 200:
-            return {"error": f"Failed to retrieve meetings data. Status code: {response.status_code}"}
+            raise MeetingsFetchError(f"Failed to retrieve meetings data. Status code: {response.status_code}",
+                                     status_code=response.status_code)
         
-        # Decode JSON response
-        meetings_data = response.json()
-
-        # Check structure
-        if not meetings_data:
-            return {"error": "Empty response"}
-
-        if "Basis" not in meetings_data:
-            return {"error": "No 'Basis' field in response"}
-
-        if "Meetings" not in meetings_data["Basis"]:
-            return {"error": "No 'Meetings' field in Basis"}
-
-        # Get the meetings list
+        # Decode JSON response straight from the raw bytes
+        meetings_data = json_loads(response.content)
+    except MeetingsFetchError:
+        raise
+    except Exception as e:
+        raise MeetingsFetchError(f"Exception: {str(e)}") from e
+    
+    # Get the meetings list, treating any missing level as a malformed response
+    try:
         meetings = meetings_data["Basis"]["Meetings"]
-        
-        # Make sure we have a list even if there's a different structure
-        if not isinstance(meetings, list):
-            if isinstance(meetings, dict) and "Meeting" in meetings:
-                meetings = meetings["Meeting"]
-                if not isinstance(meetings, list):
-                    meetings = [meetings]
-            else:
-                return {"error": "Unexpected structure in Meetings field"}
-        
+    except (KeyError, TypeError):
+        raise MeetingsFetchError("Malformed BASIS response: no Basis.Meetings field") from None
+    
+    if isinstance(meetings, list):
         return meetings
-       
-    except Exception as e:
-        import traceback
-        return {"error": f"Exception: {str(e)}"}
+    
+    # Make sure we have a list even if there's a different structure
+    if isinstance(meetings, dict) and "Meeting" in meetings:
+        meetings = meetings["Meeting"]
+        return meetings if isinstance(meetings, list) else [meetings]
+    
+    raise MeetingsFetchError("Unexpected structure in Meetings field")
 
 def get_meeting_range(start_date, end_date):
-    """Get meetings for a date range"""
+    """Get meetings for a date range
+    
+    Raises MeetingsFetchError for an invalid range. A date that fails to load
+    on its own is reported in place as an {"error": ...} entry instead.
+    """
     # Parse dates
     try:
-        start = datetime.datetime.strptime(start_date, "%m/%d/%Y")
-        end = datetime.datetime.strptime(end_date, "%m/%d/%Y")
+        start = _parse_mdy(start_date)
+        end = _parse_mdy(end_date)
     except ValueError:
-        return {"error": "Invalid date format. Please use MM/DD/YYYY."}
+        raise MeetingsFetchError("Invalid date format. Please use MM/DD/YYYY.") from None
     
     # Check range
     if (end - start).days > 30:
-        return {"error": "Date range too large. Maximum range is 30 days."}
+        raise MeetingsFetchError("Date range too large. Maximum range is 30 days.")
+    
+    dates = [(start + datetime.timedelta(days=i)).strftime(MDY_FMT)
+             for i in range((end - start).days + 1)]
+    
+    now = time.monotonic()
+    
+    # Nothing to fetch if every date is already cached
+    cached = {date: _get_cached_meetings(date, now) for date in dates}
+    if all(meetings is not None for meetings in cached.values()):
+        return cached
+    
+    # Try a single range query first unless BASIS is known not to support it
+    batched = None
+    if _SUPPORTS_RANGE_QUERY or (_SUPPORTS_RANGE_QUERY is None and now >= _range_probe_retry_at):
+        batched = _get_meeting_range_batched(dates, now)
+        # Only a verified range answer is used and cached as-is
+        if batched is not None and _SUPPORTS_RANGE_QUERY:
+            for date, date_meetings in batched.items():
+                _cache_meetings(date, date_meetings, now)
+            return batched
+    
+    # Requests are independent and I/O-bound, so fetch them concurrently
+    results = {}
+    with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(dates) or 1)) as executor:
+        futures = {executor.submit(get_meetings, date): date for date in dates}
+        for future in as_completed(futures):
+            date = futures[future]
+            # One failed date shouldn't take down the whole range
+            try:
+                results[date] = future.result()
+            except MeetingsFetchError as e:
+                results[date] = {"error": str(e)}
+            except Exception as e:
+                results[date] = {"error": f"Exception: {str(e)}"}
     
-    meetings_by_date = {}
+    # Assemble in date order rather than completion order
+    meetings_by_date = {date: results[date] for date in dates}
+    
+    # Trust the range query only once its answer matches the per-date results
+    if batched is not None:
+        _verify_range_query(batched, meetings_by_date, now)
+    
+    return meetings_by_date
+
+def fetch_meetings(start_date, end_date):
+    """Get a flat list of meetings from start_date through end_date"""
+    if start_date == end_date:
+        return get_meetings(start_date)
+    
+    meetings_by_date = get_meeting_range(start_date, end_date)
+    
+    # Flatten meetings, skipping dates that failed to load
+    all_meetings = []
+    for meetings in meetings_by_date.values():
+        if isinstance(meetings, list):
+            all_meetings.extend(meetings)
+    return all_meetings
+
+def _get_meeting_range_batched(dates, now):
+    """Get meetings for consecutive dates with one BASIS query, partitioned by date
+    
+    Returns None when the answer can't be used, in which case the caller
+    falls back to per-date requests. A rejected query or a meeting outside
+    the range marks the range query unsupported; a failed request or, before
+    support is confirmed, an empty answer only postpones the next probe.
+    """
+    global _SUPPORTS_RANGE_QUERY, _range_probe_retry_at
     
-    # Get meetings for each date in the range
-    current = start
-    while current <= end:
-        date_str = current.strftime("%m/%d/%Y")
-        meetings = get_meetings(date_str)
-        meetings_by_date[date_str] = meetings
-        current += datetime.timedelta(days=1)
+    try:
+        meetings = _query_meetings(f"meetings;startdate={dates[0]};enddate={dates[-1]};details")
+    except MeetingsFetchError as e:
+        # A 4xx means BASIS rejected the query; anything else may be transient
+        if e.status_code is not None and 400 <= e.status_code < 500:
+            _SUPPORTS_RANGE_QUERY = False
+        elif _SUPPORTS_RANGE_QUERY is None:
+            _range_probe_retry_at = now + CACHE_TTL
+        return None
+    
+    # An empty result can't tell a supported query from an ignored one until
+    # support has been confirmed
+    if not meetings and _SUPPORTS_RANGE_QUERY is None:
+        _range_probe_retry_at = now + CACHE_TTL
+        return None
+    
+    # Partition by meeting date; a date outside the range means the server
+    # ignored startdate/enddate
+    meetings_by_date = {date: [] for date in dates}
+    for meeting in meetings:
+        year, _, rest = meeting.get("MeetingDate", "").partition("-")
+        month, _, day = rest.partition("-")
+        date = f"{month}/{day}/{year}"
+        if date not in meetings_by_date:
+            _SUPPORTS_RANGE_QUERY = False
+            return None
+        meetings_by_date[date].append(meeting)
     
     return meetings_by_date
 
+def _verify_range_query(batched, meetings_by_date, now):
+    """Compare an unverified range query answer against per-date results
+    
+    A server that ignores startdate/enddate can still answer with meetings
+    that all fall inside the range (e.g. just the first day), so support is
+    only confirmed when every date holds the same meetings both ways and at
+    least two dates have meetings to tell the answers apart.
+    """
+    global _SUPPORTS_RANGE_QUERY, _range_probe_retry_at
+    
+    # A date that failed to load leaves nothing to compare against
+    if not all(isinstance(meetings, list) for meetings in meetings_by_date.values()):
+        _range_probe_retry_at = now + CACHE_TTL
+        return
+    
+    # With meetings on only one date, a single-day answer would match too
+    if sum(1 for meetings in meetings_by_date.values() if meetings) < 2:
+        _range_probe_retry_at = now + CACHE_TTL
+        return
+    
+    _SUPPORTS_RANGE_QUERY = all(
+        sorted(map(meeting_custom_id, batched[date])) == sorted(map(meeting_custom_id, meetings))
+        for date, meetings in meetings_by_date.items()
+    )
+
 def get_chamber(meeting):
     """Get chamber name from meeting data"""
     chamber = meeting.get("Chamber")
@@ -141,13 +407,46 @@ def build_title(meeting):
     
     return title.title()
     
+def _parse_mdy(date_str):
+    """Parse a 'MM/DD/YYYY' date string into a date
+    
+    Well-formed input is split by hand, which is much cheaper than strptime;
+    anything else goes through strptime so malformed dates still raise ValueError.
+    """
+    parts = date_str.split("/")
+    if len(parts) == 3 and len(parts[2]) == 4 and all(part.isdigit() for part in parts):
+        month, day, year = parts
+        return datetime.date(int(year), int(month), int(day))
+    return datetime.datetime.strptime(date_str, MDY_FMT).date()
+
+def _parse_meeting_datetime(date_str, time_str):
+    """Parse BASIS 'YYYY-MM-DD' and 'HH:MM:SS' strings into a datetime"""
+    try:
+        return datetime.datetime.combine(
+            datetime.date.fromisoformat(date_str),
+            datetime.time.fromisoformat(time_str)
+        )
+    except ValueError:
+        return datetime.datetime.strptime(f"{date_str} {time_str}", BASIS_DATETIME_FMT)
+
+def _parse_meeting_time(time_str):
+    """Parse a BASIS 'HH:MM:SS' string into a time"""
+    try:
+        return datetime.time.fromisoformat(time_str)
+    except ValueError:
+        return datetime.datetime.strptime(time_str, BASIS_TIME_FMT).time()
+
+def _fmt_dt(dt):
+    """Format a datetime as 'YYYY-MM-DD HH:MM:SS' without going through strftime"""
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} {dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
+
 def format_short_date(date_str):
     """Format date string to 'MM/DD/YY'"""
     try:
         # Parse the date (assuming MM/DD/YYYY format)
-        date_obj = datetime.datetime.strptime(date_str, "%m/%d/%Y")
+        date_obj = _parse_mdy(date_str)
         # Format with shorter year
-        return date_obj.strftime("%m/%d/%y")
+        return date_obj.strftime(MDY_SHORT_FMT)
     except ValueError:
         # Return original if there's an issue
         return date_str
@@ -156,16 +455,22 @@ def format_date_with_day(date_str):
     """Format date string with day of week: 'Tuesday April 22, 2025'"""
     try:
         # Parse the date (assuming MM/DD/YYYY format)
-        date_obj = datetime.datetime.strptime(date_str, "%m/%d/%Y")
+        date_obj = _parse_mdy(date_str)
         # Format with day of week
-        return date_obj.strftime("%A %B %d, %Y")
+        return date_obj.strftime(DOW_FMT)
     except ValueError:
         # Return original if there's an issue
         return date_str
 
 def extract_bills_with_details(meeting):
-    """Extract bills with their related details from meeting slices"""
+    """Extract bills with their related details from meeting slices
+    
+    Returns:
+        A tuple of (bill_details, general_items, short_titles) where
+        short_titles maps each bill root to its short title
+    """
     bill_details = []
+    short_titles = {}
     meeting_slices = meeting.get("MeetingSlices", [])
     
     # Group slices by bill
@@ -175,13 +480,23 @@ def extract_bills_with_details(meeting):
     # Track what details we've already added to avoid duplicates
     used_details = set()
     
+    # Highlight texts from slices without a bill, candidates for general items
+    unbilled_texts = []
+    
     for slice in meeting_slices:
         bill_root = slice.get("BillRoot", "")
         highlight_text = slice.get("SliceHighliteText", "")
         
+        # Remember the first short title seen for each bill
+        if bill_root and "ShortTitle" in slice and bill_root not in short_titles:
+            short_titles[bill_root] = slice.get("ShortTitle", "")
+        
         # Skip empty slices
         if not bill_root and not highlight_text:
             continue
+        
+        # Normalize the highlight text once per slice
+        is_cancel_text = bool(highlight_text) and CANCEL_TEXT in highlight_text.upper()
             
         # If we have a new bill, start a new group
         if bill_root and bill_root != current_bill:
@@ -194,45 +509,43 @@ def extract_bills_with_details(meeting):
             current_details = []
         
         # Add highlight text as a detail for the current bill
-        if current_bill and highlight_text and "MEETING CANCELED" not in highlight_text.upper():
+        if current_bill and highlight_text and not is_cancel_text:
             # Don't add the bill itself as a detail
             if not (bill_root and bill_root == highlight_text):
                 # Remember we've used this detail with a bill
                 used_details.add(highlight_text)
                 current_details.append(highlight_text)
+        
+        if not bill_root and highlight_text and not is_cancel_text:
+            unbilled_texts.append(highlight_text)
     
     # Add the last bill group if it exists
     if current_bill and current_details:
         bill_details.append({"bill": current_bill, "details": current_details})
     
-    # Find slices with no bill but with highlight text that hasn't been used with a bill
+    # Keep unbilled highlight texts that weren't already associated with a bill
     general_items = []
-    for slice in meeting_slices:
-        bill_root = slice.get("BillRoot", "")
-        highlight_text = slice.get("SliceHighliteText", "")
-        
-        if not bill_root and highlight_text and "MEETING CANCELED" not in highlight_text.upper():
-            # Only add items that weren't already associated with a bill
-            if highlight_text not in used_details and highlight_text not in general_items:
-                general_items.append(highlight_text)
+    seen = set(used_details)
+    for highlight_text in unbilled_texts:
+        if highlight_text not in seen:
+            seen.add(highlight_text)
+            general_items.append(highlight_text)
     
-    return bill_details, general_items
+    return bill_details, general_items, short_titles
 
-def build_description(meeting, for_csv=False):
-    """Build a description from the meeting slices and bills with their details
+def build_description_from_parts(meeting, bill_details, general_items, short_titles, for_csv=False):
+    """Build a description from bill details already extracted from the meeting
     
     Args:
         meeting: The meeting data
+        bill_details, general_items, short_titles: Output of extract_bills_with_details
         for_csv: If True, excludes stream info from the description
     """
     description_parts = []
     
     # Check if meeting is canceled
     if meeting.get("MeetingCanceled", False):
-        description_parts.append("** MEETING CANCELED **")
-    
-    # Get bills with their details
-    bill_details, general_items = extract_bills_with_details(meeting)
+        description_parts.append(CANCELED_NOTICE)
     
     # Format bills with their details
     if bill_details:
@@ -243,11 +556,7 @@ def build_description(meeting, for_csv=False):
             
             if details:
                 # Get the short title for the bill if available
-                short_title = ""
-                for slice in meeting.get("MeetingSlices", []):
-                    if slice.get("BillRoot") == bill and "ShortTitle" in slice:
-                        short_title = slice.get("ShortTitle", "")
-                        break
+                short_title = short_titles.get(bill, "")
                 
                 # Use short title if available, otherwise just use bill number
                 if short_title:
@@ -255,8 +564,10 @@ def build_description(meeting, for_csv=False):
                 else:
                     bill_text = bill
                 
-                # Add details after the bill
-                bill_text += " " + " ".join(details)
+                # Add details after the bill, leaving out streaming info for CSV
+                shown_details = _without_stream_info(details) if for_csv else details
+                if shown_details:
+                    bill_text += " " + " ".join(shown_details)
             else:
                 bill_text = bill
                 
@@ -264,31 +575,45 @@ def build_description(meeting, for_csv=False):
         
         description_parts.append("Bills: " + ", ".join(bill_texts))
     
-    # Add general items
+    # Add general items, leaving out streaming info for CSV
+    if for_csv:
+        general_items = _without_stream_info(general_items)
     if general_items:
-        description_parts.append(" | ".join(general_items))
-    
-    # Build the full description
-    description = " | ".join(description_parts)
+        description_parts.append(SEP.join(general_items))
     
-    # Remove streaming info for CSV exports if needed
-    if for_csv:
-        description = description.replace("**Streamed live on AKL.tv**", "").replace(" |  | ", " | ").strip()
-        # Clean up any trailing or double separators after removing streaming info
-        while " | |" in description:
-            description = description.replace(" | |", " |")
-        if description.endswith(" | "):
-            description = description[:-3]
-    
-    return description
+    # Only non-empty parts were added, so no separator cleanup is needed
+    return SEP.join(description_parts)
+
+def _without_stream_info(texts):
+    """Remove the streaming marker from each text, dropping any left empty"""
+    cleaned = (text.replace(STREAM_MARKER, "").strip() for text in texts)
+    return [text for text in cleaned if text]
+
+def prepare_meeting(meeting):
+    """Compute the derived display fields for a meeting once, storing them as '_prepared'"""
+    # Meetings are cached between requests, so viewing and then exporting
+    # the same day reuses the fields
+    prepared = meeting.get("_prepared")
+    if prepared is not None:
+        return prepared
+    
+    bill_details, general_items, short_titles = extract_bills_with_details(meeting)
+    prepared = meeting["_prepared"] = {
+        "title": build_title(meeting),
+        "bill_details": bill_details,
+        "general_items": general_items,
+        "description_html": build_description_from_parts(meeting, bill_details, general_items, short_titles),
+        "description_csv": build_description_from_parts(meeting, bill_details, general_items, short_titles, for_csv=True)
+    }
+    return prepared
 
 def should_skip_event(meeting):
     """Determine if a meeting should be skipped"""
     # Skip "No meeting scheduled" meetings
     meeting_slices = meeting.get("MeetingSlices", [])
     for slice in meeting_slices:
-        highlight_text = slice.get("SliceHighliteText", "").strip().lower()
-        if highlight_text == "no meeting scheduled":
+        highlight_text = slice.get("SliceHighliteText", "")
+        if highlight_text and highlight_text.strip().upper() in SKIP_MARKERS:
             return True
     
     return False
@@ -305,10 +630,22 @@ def generate_custom_id(meeting):
     sponsor = meeting.get("MeetingSponsor", "")
     return f"{chamber}-{sponsor}{date_str.replace('-', '')}{time_str.replace(':', '')}"
 
-def render_index_html():
-    """Render index page HTML"""
-    today = datetime.datetime.now().strftime("%m/%d/%Y")
-    tomorrow = (datetime.datetime.now() + datetime.timedelta(days=1)).strftime("%m/%d/%Y")
+def meeting_custom_id(meeting):
+    """Get the meeting's custom ID, computing it once and storing it as '_cid'"""
+    custom_id = meeting.get("_cid")
+    if custom_id is None:
+        custom_id = meeting["_cid"] = generate_custom_id(meeting)
+    return custom_id
+
+@functools.lru_cache(maxsize=2)
+def render_index_html(day_key):
+    """Render index page HTML for the given ISO date
+    
+    Only the default dates change from day to day, so the page is cached per day.
+    """
+    day = datetime.date.fromisoformat(day_key)
+    today = day.strftime(MDY_FMT)
+    tomorrow = (day + datetime.timedelta(days=1)).strftime(MDY_FMT)
     
     html = f"""
     <!DOCTYPE html>
@@ -400,19 +737,47 @@ def render_index_html():
     
     return html
 
-def render_meetings_html(meetings, date_info, is_range=False):
-    """Render meetings list HTML"""
-    if isinstance(meetings, dict) and "error" in meetings:
-        return f"<h1>Error</h1><p>{meetings['error']}</p>"
-    
+def _meeting_rows(date, date_meetings):
+    """Yield the display fields for each meeting row listed under a date"""
+    for i, meeting in enumerate(date_meetings):
+        # Derive title, bills and description from one pass over the slices
+        prepared = prepare_meeting(meeting)
+        
+        # Format time
+        time_str = meeting.get("MeetingTime", "")
+        if time_str:
+            try:
+                time_obj = _parse_meeting_time(time_str)
+                formatted_time = time_obj.strftime(DISPLAY_TIME_FMT)
+            except ValueError:
+                formatted_time = time_str
+        else:
+            formatted_time = "No Time"
+        
+        bill_details = prepared["bill_details"]
+        
+        yield {
+            "row_id": f"meeting-{date.replace('/', '')}-{i}",
+            "custom_id": meeting_custom_id(meeting),
+            "title": prepared["title"],
+            "canceled": meeting.get("MeetingCanceled", False),
+            "location": meeting.get("Location", "No Location"),
+            "time": formatted_time,
+            "bills": ", ".join([item["bill"] for item in bill_details]) if bill_details else "None",
+            # Keep streaming info for HTML display
+            "description": prepared["description_html"]
+        }
+
+def iter_meetings_html(meetings, date_info, is_range=False):
+    """Render the meetings page template, yielding HTML chunks as they are generated"""
     if is_range:
         start_formatted = format_date_with_day(date_info['start'])
         end_formatted = format_date_with_day(date_info['end'])
         title = f"Gavel Meeting Exporter - {start_formatted} to {end_formatted}"
     else:
         formatted_date = format_date_with_day(date_info)
-        title = f"Gavel Meeting Exporter - {formatted_date}"    
-        
+        title = f"Gavel Meeting Exporter - {formatted_date}"
+    
     # Prepare meetings by date for display
     meetings_by_date = {}
     if is_range:
@@ -435,288 +800,41 @@ def render_meetings_html(meetings, date_info, is_range=False):
     # Count total valid meetings
     total_meetings = sum(len(meetings) for meetings in meetings_by_date.values())
     
-    html = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <title>{title}</title>
-        <style>
-            body {{ font-family: Arial, sans-serif; margin: 20px; }}
-            h1, h2, h3 {{ color: #003366; }}
-            table {{ border-collapse: collapse; width: 100%; margin-top: 20px; }}
-            th, td {{ padding: 8px; text-align: left; border: 1px solid #ddd; vertical-align: top; }}
-            th {{ background-color: #003366; color: white; }}
-            tr:nth-child(even) {{ background-color: #f2f2f2; }}
-            .canceled {{ color: #cc0000; font-weight: bold; }}
-            .btn {{ padding: 8px 15px; background-color: #003366; color: white; border: none; cursor: pointer; margin-right: 10px; margin-bottom: 10px; }}
-            form {{ margin-top: 20px; }}
-            label {{ display: block; margin: 8px 0; }}
-            input[type="text"] {{ padding: 5px; width: 200px; }}
-            input[type="checkbox"] {{ margin-right: 5px; }}
-            .export-form {{ background-color: #f9f9f9; padding: 15px; border: 1px solid #ddd; border-radius: 4px; margin-top: 20px; }}
-            .form-row {{ margin-bottom: 10px; }}
-            .checkbox-row {{ margin-bottom: 5px; }}
-            .back-btn {{ margin-bottom: 20px; }}
-            .date-header {{ background-color: #003366; color: white; padding: 10px; margin-top: 30px; margin-bottom: 0; }}
-            .description-cell {{ max-width: 300px; white-space: normal; }}
-            .encoder-select {{ display: none; width: 200px; }}
-            .encoder-select.active {{ display: block; }}
-            select {{ padding: 5px; }}
-        </style>
-    </head>
-    <body>
-        <a href="/" class="btn back-btn">← Back to Date Selection</a>
-        
-        <h1>{title}</h1>
-        
-        <div class="export-options">
-            <a href="{'export_csv_range' if is_range else 'export_csv'}?date={date_info['start'] if is_range else date_info}" class="btn">Export All to CSV</a>
-        </div>
-        
-        <h2>Meetings</h2>
-    """
-    
-    if not total_meetings:
-        html += "<p>No meetings found for this date period.</p>"
-        html += "</body></html>"
-        return html
-    
-    html += f"<p>Found {total_meetings} meetings. Select meetings for Invintus export:</p>"
-    
-    # Start form for Invintus export
-    html += f"""
-    <form method="post" action="{'export_invintus_range' if is_range else 'export_invintus'}" id="invintus-form">
-        <input type="hidden" name="date_info" value="{date_info['start'] + ' to ' + date_info['end'] if is_range else date_info}">
-        
-        <div>
-            <button type="button" class="btn" onclick="selectAll()">Select All</button>
-            <button type="button" class="btn" onclick="deselectAll()">Deselect All</button>
-        </div>
-    """
-    
-    # For each date, create a table
-    for date in sorted(meetings_by_date.keys()):
-        date_meetings = meetings_by_date[date]
-    
-        # Add date header - CHANGE THIS LINE
-        formatted_date = format_date_with_day(date)
-        html += f'<h3 class="date-header">Meetings for {formatted_date}</h3>'
-    
-        # Add table for this date
-        html += """
-        <table>
-            <tr>
-                <th>Select</th>
-                <th>Date</th>
-                <th>Title</th>
-                <th>Status</th>
-                <th>Location</th>
-                <th>Time</th>
-                <th>Encoder</th>
-                <th>Bills</th>
-                <th>Description</th>
-            </tr>
-        """
-        
-        # Add meeting rows for this date
-        for i, meeting in enumerate(date_meetings):
-            # Get basic meeting info
-            title = build_title(meeting)
-            location = meeting.get("Location", "No Location")
-            canceled = meeting.get("MeetingCanceled", False)
-            status = '<span class="canceled">CANCELED</span>' if canceled else "Active"
-            
-            # Format time
-            time_str = meeting.get("MeetingTime", "")
-            if time_str:
-                try:
-                    time_obj = datetime.datetime.strptime(time_str, "%H:%M:%S")
-                    formatted_time = time_obj.strftime("%I:%M %p")
-                except ValueError:
-                    formatted_time = time_str
-            else:
-                formatted_time = "No Time"
-            
-            # Get bills with details
-            bill_details, _ = extract_bills_with_details(meeting)
-            bills_str = ", ".join([item["bill"] for item in bill_details]) if bill_details else "None"
-            
-            # Get description (keep streaming info for HTML display)
-            description = build_description(meeting)
-            
-            # Generate custom ID for this meeting
-            custom_id = generate_custom_id(meeting)
-            meeting_row_id = f"meeting-{date.replace('/', '')}-{i}"
-            
-            # Add row to table
-            html += f"<tr id='{meeting_row_id}'>"
-            
-            # Select checkbox
-            html += f"""
-            <td>
-                <input type="checkbox" name="selected_meetings" value="{custom_id}" 
-                    data-meeting-id="{meeting_row_id}" 
-                    data-title="{title}" 
-                    onchange="toggleEncoder(this)">
-            </td>
-            """
-
-            # Date column - this is new
-            html += f"<td>{format_short_date(date)}</td>"
-
-            # Other columns
-            html += f"<td>{title}</td>"
-            html += f"<td>{status}</td>"
-            html += f"<td>{location}</td>"
-            html += f"<td>{formatted_time}</td>"
-            
-            # Encoder dropdown
-            html += f"""
-            <td>
-                <select name="encoder_{custom_id}" class="encoder-select" id="encoder-{meeting_row_id}">
-                    <option value="">Select Encoder</option>
-            """
-            
-            # Add encoder options
-            for encoder in ENCODERS:
-                html += f'<option value="{encoder["id"]}">{encoder["name"]}</option>'
-            
-            html += """
-                </select>
-            </td>
-            """
-            
-            # Bills and Description
-            html += f"<td>{bills_str}</td>"
-            html += f'<td class="description-cell">{description}</td>'
-            
-            html += "</tr>"
-        
-        html += "</table>"
+    # Rows are produced lazily so each date's table is rendered as it streams
+    dates = (
+        (format_date_with_day(date), format_short_date(date), _meeting_rows(date, meetings_by_date[date]))
+        for date in sorted(meetings_by_date.keys())
+    )
     
-    # Add Invintus export options
-    html += """
-    <div class="export-form">
-        <h3>Invintus Export Options</h3>
-        
-        <div class="form-row">
-            <label for="runtime">Estimated Runtime (HH:MM):</label>
-            <input type="text" id="runtime" name="runtime" value="01:00" pattern="[0-9]{2}:[0-9]{2}" title="Format: HH:MM (e.g., 01:30)" required>
-        </div>
-        
-        <div class="form-row checkbox-row">
-            <label>
-                <input type="checkbox" id="live_to_break" name="live_to_break" value="TRUE" checked>
-                Live To Break
-            </label>
-        </div>
-        
-        <div class="form-row">
-            <button type="submit" class="btn">Export Selected to Invintus CSV</button>
-        </div>
-    </div>
-    </form>
+    # Jinja caches the compiled template and autoescapes every field
+    template = app.jinja_env.get_template("meetings.html")
+    stream = template.stream(
+        page_title=title,
+        is_range=is_range,
+        export_date=date_info['start'] if is_range else date_info,
+        form_date_info=date_info['start'] + ' to ' + date_info['end'] if is_range else date_info,
+        total_meetings=total_meetings,
+        dates=dates,
+        encoder_options=Markup(ENCODER_OPTIONS_HTML)
+    )
     
-    // Replace the entire script section in your render_meetings_html function with this:
-
-    <script>
-function selectAll() {
-    var checkboxes = document.querySelectorAll('input[name="selected_meetings"]');
-    checkboxes.forEach(function(checkbox) {
-        checkbox.checked = true;
-        toggleEncoder(checkbox);
-    });
-}
+    # Group Jinja's many small fragments into fewer, larger chunks
+    stream.enable_buffering(64)
+    yield from stream
 
-function deselectAll() {
-    var checkboxes = document.querySelectorAll('input[name="selected_meetings"]');
-    checkboxes.forEach(function(checkbox) {
-        checkbox.checked = false;
-        toggleEncoder(checkbox);
-    });
-}
-
-function toggleEncoder(checkbox) {
-    var meetingId = checkbox.getAttribute('data-meeting-id');
-    var encoderSelect = document.getElementById('encoder-' + meetingId);
-    
-    if (checkbox.checked) {
-        encoderSelect.classList.add('active');
-        
-        // Set default category as "Gavel Alaska, [Title]"
-        var title = checkbox.getAttribute('data-title');
-        var meetingValue = checkbox.value;
-        var hiddenInput = document.getElementById('category-' + meetingValue);
-        
-        if (!hiddenInput) {
-            hiddenInput = document.createElement('input');
-            hiddenInput.type = 'hidden';
-            hiddenInput.name = 'category_' + meetingValue;
-            hiddenInput.id = 'category-' + meetingValue;
-            document.getElementById('invintus-form').appendChild(hiddenInput);
-        }
-        
-        hiddenInput.value = 'Gavel Alaska, ' + title;
-    } else {
-        encoderSelect.classList.remove('active');
-        encoderSelect.value = '';
-        
-        // Remove category hidden input
-        var meetingValue = checkbox.value;
-        var hiddenInput = document.getElementById('category-' + meetingValue);
-        if (hiddenInput) {
-            hiddenInput.parentNode.removeChild(hiddenInput);
-        }
-    }
-}
+def _drain(output):
+    """Return the text buffered in output and reset it for reuse"""
+    chunk = output.getvalue()
+    output.seek(0)
+    output.truncate(0)
+    return chunk
 
-document.getElementById('invintus-form').onsubmit = function(e) {
-    var checkboxes = document.querySelectorAll('input[name="selected_meetings"]:checked');
-    if (checkboxes.length === 0) {
-        alert('Please select at least one meeting to export.');
-        e.preventDefault();
-        return false;
-    }
-    
-    // Check if any selected meetings don't have encoders
-    var missingEncoders = false;
-    var encoderSelects = [];
-    
-    checkboxes.forEach(function(checkbox) {
-        var meetingId = checkbox.getAttribute('data-meeting-id');
-        var encoderSelect = document.getElementById('encoder-' + meetingId);
-        
-        if (!encoderSelect.value) {
-            missingEncoders = true;
-            encoderSelects.push(encoderSelect);
-        }
-    });
-    
-    // If some encoders are missing, show a warning but allow continuing
-    if (missingEncoders) {
-        // Highlight the missing encoders
-        encoderSelects.forEach(function(select) {
-            select.style.border = '2px solid orange';
-        });
-        
-        // Ask for confirmation
-        if (!confirm('Some meetings are missing encoder selections. These will be exported with blank encoder values. Continue?')) {
-            e.preventDefault();
-            return false;
-        }
-    }
+def iter_meetings_csv(meetings, include_date=False):
+    """Format meetings for standard CSV, yielding chunks of about CSV_CHUNK_SIZE
     
-    return true;
-};
-    </script>
-    </body>
-    </html>
+    The header is always written, so an export with no meetings is a
+    header-only CSV.
     """
-    
-    return html
-
-def format_meetings_csv(meetings, include_date=False):
-    """Format meetings for standard CSV"""
     output = StringIO()
     writer = csv.writer(output, quoting=csv.QUOTE_ALL)
     
@@ -728,14 +846,20 @@ def format_meetings_csv(meetings, include_date=False):
     # Write header
     writer.writerow(fields)
     
+    # Rows are written in batches so the csv module loops internally
+    rows = []
+    
     # Process each meeting
     for meeting in meetings:
         # Skip meetings that should be excluded
         if should_skip_event(meeting):
             continue
         
+        # Derive title, bills and description from one pass over the slices
+        prepared = prepare_meeting(meeting)
+        
         # Get basic meeting info
-        title = build_title(meeting)
+        title = prepared["title"]
         location = meeting.get("Location", "No Location")
         canceled = meeting.get("MeetingCanceled", False)
         status = "CANCELED" if canceled else "Active"
@@ -747,17 +871,17 @@ def format_meetings_csv(meetings, include_date=False):
         
         if date_str and time_str:
             try:
-                dt = datetime.datetime.strptime(f"{date_str} {time_str}", "%Y-%m-%d %H:%M:%S")
-                formatted_time = dt.strftime("%Y-%m-%d %I:%M %p")
+                dt = _parse_meeting_datetime(date_str, time_str)
+                formatted_time = dt.strftime(CSV_DATETIME_FMT)
             except ValueError:
                 formatted_time = f"{date_str} {time_str}"
         
         # Get bills with details for description
-        bill_details, _ = extract_bills_with_details(meeting)
+        bill_details = prepared["bill_details"]
         bills_str = ", ".join([item["bill"] for item in bill_details]) if bill_details else ""
         
-        # Build description for CSV export (exclude streaming info)
-        description = build_description(meeting, for_csv=True)
+        # Description for CSV export (excludes streaming info)
+        description = prepared["description_csv"]
         
         # Build row
         row = [title, status, location, formatted_time, bills_str, description]
@@ -767,141 +891,201 @@ def format_meetings_csv(meetings, include_date=False):
             display_date = meeting.get('_display_date', '')
             row.insert(0, display_date)
         
-        # Write row
-        writer.writerow(row)
-    
-    return output.getvalue()
+        # Queue row, flushing a full batch
+        rows.append(row)
+        if len(rows) >= CSV_BATCH_ROWS:
+            writer.writerows(rows)
+            rows.clear()
+            # Only yield once enough text is buffered to make a large write
+            if output.tell() >= CSV_CHUNK_SIZE:
+                yield _drain(output)
+    
+    writer.writerows(rows)
+    yield _drain(output)
 
-def format_meetings_invintus_csv(meetings, encoders, categories, runtime="01:00", live_to_break=True):
-    """Format meetings for Invintus CSV export"""
-    output = StringIO()
-    writer = csv.writer(output, quoting=csv.QUOTE_ALL)
-    
-    # Write header according to Invintus spec
-    writer.writerow(["title", "customID", "startDateTime", "description", "encoder", "category", "location", "estRuntime", "liveToBreak"])
+def iter_meetings_invintus_csv(meetings, encoders, categories, runtime="01:00", live_to_break=True):
+    """Format meetings for Invintus CSV export, yielding chunks of about CSV_CHUNK_SIZE
     
-def format_meetings_invintus_csv(meetings, encoders, categories, runtime="01:00", live_to_break=True):
-    """Format meetings for Invintus CSV export"""
+    The header is always written, so an export with no meetings is a
+    header-only CSV.
+    """
     output = StringIO()
     writer = csv.writer(output, quoting=csv.QUOTE_ALL)
     
     # Write header according to Invintus spec
-    writer.writerow(["title", "customID", "startDateTime", "description", "encoder", "category", "location", "estRuntime", "liveToBreak"])
+    output.write(_INVINTUS_HEADER)
     
-    # Set default values
+    # Set default values; every row ends with the same runtime/liveToBreak pair
     live_to_break_value = "TRUE" if live_to_break else "FALSE"
+    tail = (runtime, live_to_break_value)
+    
+    # Bind globals and methods used per row to locals for faster lookups
+    _skip = should_skip_event
+    _prepare = prepare_meeting
+    _cid = meeting_custom_id
+    _strptime = datetime.datetime.strptime
+    _format_row = _INVINTUS_ROW_FMT.format
+    _write = output.write
+    _writerow = writer.writerow
+    _get_category = categories.get
     
     # Process each meeting
     for meeting in meetings:
         # Skip meetings that should be excluded
-        if should_skip_event(meeting):
+        if _skip(meeting):
             continue
         
         # Parse date/time
-        date_str = meeting.get("MeetingDate", "")
-        time_str = meeting.get("MeetingTime", "")
+        get = meeting.get
+        date_str = get("MeetingDate", "")
+        time_str = get("MeetingTime", "")
         
         if not date_str or not time_str:
             continue
         
-        try:
-            # Format datetime in the required format: YYYY-MM-DD HH:mm:ss
-            dt = datetime.datetime.strptime(f"{date_str} {time_str}", "%Y-%m-%d %H:%M:%S")
-            start_datetime = dt.strftime("%Y-%m-%d %H:%M:%S")
-        except ValueError:
-            continue
+        # Format datetime in the required format: YYYY-MM-DD HH:mm:ss.
+        # BASIS already sends exactly that layout, so well-formed values are
+        # concatenated as-is and only odd ones go through strptime.
+        if (len(date_str) == 10 and len(time_str) == 8
+                and date_str[4] == "-" and date_str[7] == "-"
+                and time_str[2] == ":" and time_str[5] == ":"
+                and (date_str[:4] + date_str[5:7] + date_str[8:]
+                     + time_str[:2] + time_str[3:5] + time_str[6:]).isdigit()):
+            start_datetime = date_str + " " + time_str
+        else:
+            try:
+                dt = _strptime(f"{date_str} {time_str}", BASIS_DATETIME_FMT)
+                start_datetime = _fmt_dt(dt)
+            except ValueError:
+                continue
         
         # Build meeting data for CSV
         
-        # 1. Title
-        title = build_title(meeting)
-        
-        # 2. customID (no whitespace)
-        custom_id = generate_custom_id(meeting)
+        # 2. customID (no whitespace), already computed when filtering
+        custom_id = _cid(meeting)
         
         # Include all selected meetings, even if no encoder is set
         if custom_id not in encoders:
             continue  # Skip unselected meetings
         
+        # 1. Title, from the fields prepared once per meeting
+        prepared = _prepare(meeting)
+        title = prepared["title"]
+        
         # 3. startDateTime already formatted above
         
-        # 4. Description - use for_csv=True to exclude streaming info
-        description = build_description(meeting, for_csv=True)
+        # 4. Description - the CSV variant excludes streaming info
+        description = prepared["description_csv"]
         
         # 5. encoder (using selected encoder or empty string if none)
         encoder = encoders[custom_id] if encoders[custom_id] else ""
         
         # 6. category (using custom category for each meeting)
-        category = categories.get(custom_id, "Gavel Alaska")
+        category = _get_category(custom_id, "Gavel Alaska")
         
         # 7. location
-        location = meeting.get("Location", "")
+        location = get("Location") or ""
         
-        # Write row with all fields
-        writer.writerow([
+        # Build row with all fields
+        row = (
             title,
             custom_id,
             start_datetime,
             description,
             encoder,
             category,
-            location,
-            runtime,
-            live_to_break_value
-        ])
+            location
+        ) + tail
+        
+        # Most rows have nothing to escape, so fill in the row template and
+        # leave any row with an embedded quote to the csv module
+        line = _format_row(*row)
+        if line.count('"') == _INVINTUS_ROW_QUOTES:
+            _write(line)
+        else:
+            _writerow(row)
+        
+        # Only yield once enough text is buffered to make a large write
+        if output.tell() >= CSV_CHUNK_SIZE:
+            yield _drain(output)
+    
+    yield _drain(output)
+
+def _gzip_chunks(chunks):
+    """Gzip-compress a stream of text chunks, yielding compressed bytes as they are produced"""
+    buf = BytesIO()
+    with gzip.GzipFile(fileobj=buf, mode="wb") as gz:
+        for chunk in chunks:
+            gz.write(chunk.encode("utf-8"))
+            if buf.tell():
+                yield _drain(buf)
+    yield _drain(buf)
+
+def csv_response(chunks, filename):
+    """Stream CSV chunks as a download, gzip-compressed when the client accepts it"""
+    headers = {
+        "Content-disposition": f"attachment; filename={filename}",
+        "Vary": "Accept-Encoding"
+    }
     
-    return output.getvalue()
+    # The body is streamed, so its length isn't known up front
+    if request.accept_encodings["gzip"]:
+        headers["Content-Encoding"] = "gzip"
+        chunks = _gzip_chunks(chunks)
+    
+    return Response(chunks, mimetype="text/csv", headers=headers)
 
 # Flask routes
+@app.errorhandler(MeetingsFetchError)
+def handle_fetch_error(e):
+    """Report a failed meetings fetch to the user"""
+    return f"Error: {escape(str(e))}"
+
 @app.route('/')
 def index():
     """Main page with date selection"""
-    return render_index_html()
+    return render_index_html(datetime.date.today().isoformat())
+
+@app.route('/clear_cache', methods=['POST'])
+def clear_cache():
+    """Clear cached BASIS responses to pick up late meeting edits"""
+    clear_meetings_cache()
+    return "Cache cleared"
 
 @app.route('/view')
 def view_meetings():
     """View meetings for a single date"""
-    date = request.args.get('date', datetime.datetime.now().strftime("%m/%d/%Y"))
+    date = request.args.get('date', datetime.datetime.now().strftime(MDY_FMT))
     
     # Get meetings
     meetings_data = get_meetings(date)
     
-    # Render HTML
-    return render_meetings_html(meetings_data, date)
+    # Render HTML, streaming it as it is generated
+    return Response(stream_with_context(iter_meetings_html(meetings_data, date)), mimetype="text/html")
 
 @app.route('/view_range')
 def view_range():
     """View meetings for a date range"""
-    start_date = request.args.get('start_date', datetime.datetime.now().strftime("%m/%d/%Y"))
-    end_date = request.args.get('end_date', (datetime.datetime.now() + datetime.timedelta(days=1)).strftime("%m/%d/%Y"))
+    start_date = request.args.get('start_date', datetime.datetime.now().strftime(MDY_FMT))
+    end_date = request.args.get('end_date', (datetime.datetime.now() + datetime.timedelta(days=1)).strftime(MDY_FMT))
     
     # Get meetings for the date range
     meetings_by_date = get_meeting_range(start_date, end_date)
     
     # Render HTML
     date_info = {'start': start_date, 'end': end_date}
-    return render_meetings_html(meetings_by_date, date_info, True)
+    return Response(stream_with_context(iter_meetings_html(meetings_by_date, date_info, True)), mimetype="text/html")
 
 @app.route('/export_csv')
 def export_csv():
     """Export meetings for a single date as CSV"""
-    date = request.args.get('date', datetime.datetime.now().strftime("%m/%d/%Y"))
+    date = request.args.get('date', datetime.datetime.now().strftime(MDY_FMT))
     
     # Get meetings
     meetings_data = get_meetings(date)
     
-    if isinstance(meetings_data, dict) and "error" in meetings_data:
-        return f"Error: {meetings_data['error']}"
-    
-    # Format as CSV
-    csv_data = format_meetings_csv(meetings_data)
-    
-    # Return as downloadable file
-    return Response(
-        csv_data,
-        mimetype="text/csv",
-        headers={"Content-disposition": f"attachment; filename=meetings_{date.replace('/', '-')}.csv"}
-    )
+    # Return as downloadable file, streaming rows as they are formatted
+    return csv_response(iter_meetings_csv(meetings_data), f"meetings_{date.translate(_SLASH_TO_DASH)}.csv")
 
 @app.route('/export_csv_range')
 def export_csv_range():
@@ -920,9 +1104,6 @@ def export_csv_range():
     # Get meetings for the date range
     meetings_by_date = get_meeting_range(start_date, end_date)
     
-    if isinstance(meetings_by_date, dict) and "error" in meetings_by_date:
-        return f"Error: {meetings_by_date['error']}"
-    
     # Flatten meetings for CSV export
     all_meetings = []
     for date, meetings in meetings_by_date.items():
@@ -932,75 +1113,16 @@ def export_csv_range():
                 meeting['_display_date'] = date
                 all_meetings.append(meeting)
     
-    # Format as CSV with date column
-    csv_data = format_meetings_csv(all_meetings, True)
-    
-    # Return as downloadable file
-    return Response(
-        csv_data,
-        mimetype="text/csv",
-        headers={"Content-disposition": f"attachment; filename=meetings_{start_date.replace('/', '-')}_to_{end_date.replace('/', '-')}.csv"}
+    # Return as downloadable file with date column, streaming rows as they are formatted
+    return csv_response(
+        iter_meetings_csv(all_meetings, True),
+        f"meetings_{start_date.translate(_SLASH_TO_DASH)}_to_{end_date.translate(_SLASH_TO_DASH)}.csv"
     )
 
 @app.route('/export_invintus', methods=['POST'])
-def export_invintus():
-    """Export selected meetings to Invintus CSV format"""
-    date_info = request.form.get('date_info', '')
-    selected_meetings = request.form.getlist('selected_meetings')
-    runtime = request.form.get('runtime', '01:00')
-    live_to_break = 'live_to_break' in request.form
-    
-    if not selected_meetings:
-        return "Error: No meetings selected. Please go back and select at least one meeting."
-    
-    # Get meetings
-    meetings_data = get_meetings(date_info)
-    
-    if isinstance(meetings_data, dict) and "error" in meetings_data:
-        return f"Error: {meetings_data['error']}"
-    
-    # Get encoders and categories for each meeting
-    encoders = {}
-    categories = {}
-    
-    for meeting_id in selected_meetings:
-        # Get encoder
-        encoder_key = f"encoder_{meeting_id}"
-        if encoder_key in request.form and request.form[encoder_key]:
-            encoders[meeting_id] = request.form[encoder_key]
-        
-        # Get category
-        category_key = f"category_{meeting_id}"
-        if category_key in request.form and request.form[category_key]:
-            categories[meeting_id] = request.form[category_key]
-    
-    # Filter to only selected meetings
-    filtered_meetings = []
-    
-    for meeting in meetings_data:
-        custom_id = generate_custom_id(meeting)
-        if custom_id in selected_meetings:
-            filtered_meetings.append(meeting)
-    
-    # Generate Invintus CSV
-    csv_data = format_meetings_invintus_csv(
-        filtered_meetings,
-        encoders=encoders,
-        categories=categories,
-        runtime=runtime,
-        live_to_break=live_to_break
-    )
-    
-    # Return as downloadable file
-    return Response(
-        csv_data,
-        mimetype="text/csv",
-        headers={"Content-disposition": f"attachment; filename=invintus_meetings_{date_info.replace('/', '-')}.csv"}
-    )
-
 @app.route('/export_invintus_range', methods=['POST'])
-def export_invintus_range():
-    """Export selected meetings from a date range to Invintus CSV format"""
+def export_invintus():
+    """Export selected meetings for a date or date range to Invintus CSV format"""
     date_info = request.form.get('date_info', '')
     selected_meetings = request.form.getlist('selected_meetings')
     runtime = request.form.get('runtime', '01:00')
@@ -1009,54 +1131,40 @@ def export_invintus_range():
     if not selected_meetings:
         return "Error: No meetings selected. Please go back and select at least one meeting."
     
-    # Parse date range
+    # Parse date range; a single date is a range that starts and ends on it
     if " to " in date_info:
         start_date, end_date = date_info.split(" to ")
     else:
         start_date = end_date = date_info
     
-    # Get encoders and categories for each meeting
+    # Get encoders and categories keyed by meeting ID in a single pass over the form
     encoders = {}
     categories = {}
     
-    for meeting_id in selected_meetings:
-        # Get encoder
-        encoder_key = f"encoder_{meeting_id}"
-        if encoder_key in request.form and request.form[encoder_key]:
-            encoders[meeting_id] = request.form[encoder_key]
-        
-        # Get category
-        category_key = f"category_{meeting_id}"
-        if category_key in request.form and request.form[category_key]:
-            categories[meeting_id] = request.form[category_key]
+    for key, value in request.form.items():
+        if not value:
+            continue
+        if key.startswith("encoder_"):
+            encoders[key[len("encoder_"):]] = value
+        elif key.startswith("category_"):
+            categories[key[len("category_"):]] = value
     
     # Get meetings
-    if start_date == end_date:
-        meetings_data = get_meetings(start_date)
-        if isinstance(meetings_data, dict) and "error" in meetings_data:
-            return f"Error: {meetings_data['error']}"
-        all_meetings = meetings_data
-    else:
-        meetings_by_date = get_meeting_range(start_date, end_date)
-        if isinstance(meetings_by_date, dict) and "error" in meetings_by_date:
-            return f"Error: {meetings_by_date['error']}"
-        
-        # Flatten meetings
-        all_meetings = []
-        for date, meetings in meetings_by_date.items():
-            if isinstance(meetings, list):
-                all_meetings.extend(meetings)
+    all_meetings = fetch_meetings(start_date, end_date)
     
-    # Filter to only selected meetings
+    # Filter to only selected meetings, stopping once every selection is found
+    remaining = set(selected_meetings)
     filtered_meetings = []
-    
     for meeting in all_meetings:
-        custom_id = generate_custom_id(meeting)
-        if custom_id in selected_meetings:
+        custom_id = meeting_custom_id(meeting)
+        if custom_id in remaining:
+            remaining.discard(custom_id)
             filtered_meetings.append(meeting)
+            if not remaining:
+                break
     
-    # Generate Invintus CSV
-    csv_data = format_meetings_invintus_csv(
+    # Generate Invintus CSV rows lazily so they stream to the client
+    csv_data = iter_meetings_invintus_csv(
         filtered_meetings,
         encoders=encoders,
         categories=categories,
@@ -1065,15 +1173,11 @@ def export_invintus_range():
     )
     
     # Return as downloadable file
-    filename = f"invintus_meetings_{start_date.replace('/', '-')}"
+    filename = f"invintus_meetings_{start_date.translate(_SLASH_TO_DASH)}"
     if start_date != end_date:
-        filename += f"_to_{end_date.replace('/', '-')}"
+        filename += f"_to_{end_date.translate(_SLASH_TO_DASH)}"
     
-    return Response(
-        csv_data,
-        mimetype="text/csv",
-        headers={"Content-disposition": f"attachment; filename={filename}.csv"}
-    )
+    return csv_response(csv_data, f"{filename}.csv")
 
 if __name__ == "__main__":
     import argparse
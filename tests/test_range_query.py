@@ -0,0 +1,107 @@
+import datetime
+import json
+import unittest
+from unittest import mock
+
+import gavel_meeting_tool as tool
+
+
+def make_meeting(date_iso):
+    return {
+        "MeetingDate": date_iso,
+        "MeetingTime": "08:00:00",
+        "Chamber": "H",
+        "MeetingSponsor": "HFIN",
+        "MeetingSlices": [],
+    }
+
+
+class FakeBasis:
+    """Answers BASIS meetings queries from a {MM/DD/YYYY: meetings} table"""
+
+    def __init__(self, meetings_by_date, honor_range=True, default_date=None):
+        self.meetings_by_date = meetings_by_date
+        self.honor_range = honor_range
+        self.default_date = default_date
+        self.queries = []
+
+    def get(self, url, headers=None, **kwargs):
+        query = headers["X-Alaska-Legislature-Basis-Query"]
+        self.queries.append(query)
+        params = dict(part.split("=", 1) for part in query.split(";") if "=" in part)
+
+        if "date" in params:
+            meetings = self.meetings_by_date.get(params["date"], [])
+        elif self.honor_range:
+            start = datetime.datetime.strptime(params["startdate"], tool.MDY_FMT)
+            end = datetime.datetime.strptime(params["enddate"], tool.MDY_FMT)
+            meetings = []
+            while start <= end:
+                meetings += self.meetings_by_date.get(start.strftime(tool.MDY_FMT), [])
+                start += datetime.timedelta(days=1)
+        else:
+            # Ignore startdate/enddate and answer with a single default day
+            meetings = self.meetings_by_date.get(self.default_date, [])
+
+        response = mock.Mock(status_code=200)
+        response.content = json.dumps({"Basis": {"Meetings": meetings}}).encode()
+        return response
+
+
+class RangeQueryProbeTest(unittest.TestCase):
+    def setUp(self):
+        tool.clear_meetings_cache()
+        self.addCleanup(tool.clear_meetings_cache)
+
+    def fetch(self, basis, start_date, end_date):
+        with mock.patch.object(tool.SESSION, "get", basis.get):
+            meetings_by_date = tool.get_meeting_range(start_date, end_date)
+        return {date: len(meetings) for date, meetings in meetings_by_date.items()}
+
+    def test_single_day_answer_with_one_busy_date_is_inconclusive(self):
+        basis = FakeBasis({
+            "04/21/2025": [make_meeting("2025-04-21")],
+            "04/22/2025": [make_meeting("2025-04-22")],
+        }, honor_range=False, default_date="04/22/2025")
+
+        # Only 04/22 has meetings, so the ignored range still looks right
+        counts = self.fetch(basis, "04/22/2025", "04/23/2025")
+        self.assertEqual(counts, {"04/22/2025": 1, "04/23/2025": 0})
+        self.assertIsNone(tool._SUPPORTS_RANGE_QUERY)
+        self.assertGreater(tool._range_probe_retry_at, 0)
+
+        # The earlier day must still be fetched on its own rather than
+        # partitioned out of the default-day answer
+        counts = self.fetch(basis, "04/21/2025", "04/22/2025")
+        self.assertEqual(counts, {"04/21/2025": 1, "04/22/2025": 1})
+        self.assertIsNot(tool._SUPPORTS_RANGE_QUERY, True)
+
+    def test_single_day_answer_with_two_busy_dates_is_unsupported(self):
+        basis = FakeBasis({
+            "04/22/2025": [make_meeting("2025-04-22")],
+            "04/23/2025": [make_meeting("2025-04-23")],
+        }, honor_range=False, default_date="04/22/2025")
+
+        counts = self.fetch(basis, "04/22/2025", "04/23/2025")
+        self.assertEqual(counts, {"04/22/2025": 1, "04/23/2025": 1})
+        self.assertIs(tool._SUPPORTS_RANGE_QUERY, False)
+
+    def test_matching_answer_with_two_busy_dates_confirms_support(self):
+        basis = FakeBasis({
+            "04/22/2025": [make_meeting("2025-04-22")],
+            "04/23/2025": [make_meeting("2025-04-23")],
+        })
+
+        counts = self.fetch(basis, "04/22/2025", "04/23/2025")
+        self.assertEqual(counts, {"04/22/2025": 1, "04/23/2025": 1})
+        self.assertIs(tool._SUPPORTS_RANGE_QUERY, True)
+
+        # Once confirmed, a range is answered by the single query
+        basis.queries.clear()
+        tool._meetings_cache.clear()
+        self.fetch(basis, "04/24/2025", "04/25/2025")
+        self.assertEqual(len(basis.queries), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()